@@ -1,28 +1,55 @@
-import json
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import time
 import datetime
 import random
+import threading
+import concurrent.futures
+from collections import Counter
 from typing import Dict, List, Tuple, Optional, Any
 
+import numpy as np
 import ollama
+import orjson
 from colorama import Fore, Back, Style, init
 
 # Initialize colorama
 init(autoreset=True)
 
-# Set up logging
+# Color codes used for game output
+_Y, _C, _G, _R, _W = Fore.YELLOW, Fore.CYAN, Fore.GREEN, Fore.RED, Fore.WHITE
+_ON_BLACK, _ON_BLUE = Back.BLACK, Back.BLUE
+_RESET = Style.RESET_ALL
+_BRIGHT = Style.BRIGHT
+
+# Set LOG_LEVEL=DEBUG for more detailed logs; unknown level names fall back to INFO
+_log_level_name = (os.getenv("LOG_LEVEL") or "INFO").upper()
+_log_level = getattr(logging, _log_level_name, None)
+_log_level_valid = isinstance(_log_level, int)
+if not _log_level_valid:
+    _log_level = logging.INFO
+
+# Set up logging; records are handed to a listener thread so file I/O never blocks the game
+_log_queue = queue.Queue()
 logging.basicConfig(
-    level=logging.DEBUG,  # Changed from INFO to DEBUG for more detailed logs
+    level=_log_level,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("millionaire_game.log"),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
+)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler("millionaire_game.log"),
+    logging.StreamHandler(sys.stdout)
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger("millionaire_game")
+if not _log_level_valid:
+    logger.warning("Unknown LOG_LEVEL %r, using INFO", os.getenv("LOG_LEVEL"))
 
 # Set httpx (used by ollama) to INFO level to reduce verbosity
 logging.getLogger("httpx").setLevel(logging.INFO)
@@ -49,6 +76,18 @@ MONEY_LADDER = [
 
 MILESTONES = [1000, 32000]
 
+# Display strings for each rung on the money ladder
+_MONEY_STR = tuple(f"${amount:,}" for amount in MONEY_LADDER)
+
+# Amount a player falls back to when answering wrongly, indexed by rung on the money ladder
+_FALLBACK = [
+    next((milestone for milestone in reversed(MILESTONES) if milestone <= amount), 0)
+    for amount in MONEY_LADDER
+]
+
+# Rung on the money ladder for each amount, used when restoring a saved session
+_MONEY_TO_RUNG = {amount: i for i, amount in enumerate(MONEY_LADDER)}
+
 # Define English language topics
 TOPICS = [
     "Grammar - Verb Tenses",
@@ -68,8 +107,295 @@ TOPICS = [
     "Word Formation - Prefixes and Suffixes"
 ]
 
+# Set of all topics, for picking unused ones with a set difference
+_TOPIC_SET = frozenset(TOPICS)
+
+# Pool of fallback questions used when Ollama fails; the topic is filled in when one is picked
+_FALLBACK_POOL = [
+    {
+        "question": "Which of the following is a correct sentence?",
+        "options": [
+            "A. I have been to Paris last year.",
+            "B. I went to Paris last year.",
+            "C. I have went to Paris last year.",
+            "D. I had been going to Paris last year."
+        ],
+        "correct_answer": "B",
+        "explanation": "When using a specific time in the past (last year), the simple past tense is correct. 'I went to Paris last year' is grammatically correct."
+    },
+    {
+        "question": "Which word is a synonym for 'happy'?",
+        "options": [
+            "A. Sad",
+            "B. Angry",
+            "C. Joyful",
+            "D. Tired"
+        ],
+        "correct_answer": "C",
+        "explanation": "'Joyful' means full of joy or happiness, making it a synonym for 'happy'."
+    },
+    {
+        "question": "What is the correct spelling?",
+        "options": [
+            "A. Accomodate",
+            "B. Acommodate",
+            "C. Accommodate",
+            "D. Acomodate"
+        ],
+        "correct_answer": "C",
+        "explanation": "'Accommodate' is the correct spelling with two 'c's and two 'm's."
+    },
+    {
+        "question": "Which of these is a correct use of the semicolon?",
+        "options": [
+            "A. I went to the store; and bought milk.",
+            "B. I went to the store; I bought milk.",
+            "C. I went to the store, I bought milk.",
+            "D. I went to the store; because I needed milk."
+        ],
+        "correct_answer": "B",
+        "explanation": "A semicolon is used to join two independent clauses without a conjunction. Option B correctly uses the semicolon to join two complete sentences."
+    },
+    {
+        "question": "Which sentence contains a dangling modifier?",
+        "options": [
+            "A. The teacher explained the problem to the students.",
+            "B. Walking down the street, the birds sang loudly.",
+            "C. She read the book that I recommended.",
+            "D. After finishing the assignment, the student went home."
+        ],
+        "correct_answer": "B",
+        "explanation": "In the sentence 'Walking down the street, the birds sang loudly,' the modifier 'walking down the street' is dangling because birds cannot walk down the street. The subject performing the action is missing."
+    },
+    {
+        "question": "Which of these is the correct plural form of 'child'?",
+        "options": [
+            "A. Childs",
+            "B. Childes",
+            "C. Children",
+            "D. Childrens"
+        ],
+        "correct_answer": "C",
+        "explanation": "'Children' is the correct irregular plural form of 'child'. It doesn't follow the regular pattern of adding 's' or 'es'."
+    },
+    {
+        "question": "What is the meaning of the idiom 'to hit the hay'?",
+        "options": [
+            "A. To beat someone",
+            "B. To go to sleep",
+            "C. To work in a farm",
+            "D. To exercise vigorously"
+        ],
+        "correct_answer": "B",
+        "explanation": "The idiom 'to hit the hay' means to go to bed or go to sleep. It originated from the days when mattresses were filled with hay."
+    },
+    {
+        "question": "Which sentence uses the correct form of the verb?",
+        "options": [
+            "A. Each of the students have completed the assignment.",
+            "B. Neither of my brothers are going to the party.",
+            "C. The team of doctors has arrived at the hospital.",
+            "D. The staff were divided on the issue."
+        ],
+        "correct_answer": "C",
+        "explanation": "In the sentence 'The team of doctors has arrived at the hospital,' the singular subject 'team' correctly takes the singular verb 'has'. 'Team' is a collective noun that's treated as singular when referring to the group as a single unit."
+    }
+]
+
+# Texts of all fallback questions, for resetting them once every one has been used
+_FALLBACK_QS = frozenset(q["question"] for q in _FALLBACK_POOL)
+
+# JSON schema for a single generated question
+QUESTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "topic": {"type": "string"},
+        "question": {"type": "string"},
+        "options": {
+            "type": "array",
+            "items": {"type": "string"},
+            "minItems": 4,
+            "maxItems": 4
+        },
+        "correct_answer": {"enum": ["A", "B", "C", "D"]},
+        "explanation": {"type": "string"}
+    },
+    "required": ["topic", "question", "options", "correct_answer", "explanation"]
+}
+
+# JSON schema passed to Ollama so batch responses are grammar-constrained to valid JSON
+BATCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "questions": {"type": "array", "items": QUESTION_SCHEMA}
+    },
+    "required": ["questions"]
+}
+
+# Prompt for a batch of questions. Everything before the topic list is identical across
+# calls, so Ollama can reuse its cached prefix instead of re-evaluating it every time.
+_PROMPT_TMPL = """Create multiple-choice questions for 'Who Wants to be a Millionaire' that test English language proficiency.
+
+Format your response as a JSON object with a "questions" array containing one object per topic, each with these fields:
+- topic (string): The topic exactly as given below
+- question (string): The question text
+- options (array): Four options as strings labeled with "A. ", "B. ", "C. ", "D. " prefixes
+- correct_answer (string): The letter of the correct option (A, B, C, or D)
+- explanation (string): A clear explanation of why the answer is correct
+
+IMPORTANT: Each option should be a simple string starting with the letter label, like "A. Option text here".
+
+Example of correct format:
+{{
+  "questions": [
+    {{
+      "topic": "Grammar - Verb Tenses",
+      "question": "What is the past tense of 'go'?",
+      "options": [
+        "A. Goed",
+        "B. Went",
+        "C. Gone",
+        "D. Going"
+      ],
+      "correct_answer": "B",
+      "explanation": "The irregular past tense of 'go' is 'went'."
+    }}
+  ]
+}}
+
+The questions should be challenging but fair. Provide good distractors for wrong answers.
+
+Write exactly {count} questions, one for each of these topics, in this order:
+{topics}
+"""
+
+# Ollama model used to generate questions
+DEFAULT_MODEL = "llama3.2"
+
+# Keep the model loaded between requests so later rounds don't pay the model load time again
+KEEP_ALIVE = "30m"
+
+# Context window for question requests; a full batch of 15 questions plus the prompt fits in it
+NUM_CTX = 8192
+
+# Maximum number of tokens to generate for each question in a batch
+NUM_PREDICT_PER_QUESTION = 400
+
+# Number of times to ask Ollama for a batch before using a fallback question, and the
+# initial delay in seconds between attempts after a failed request
+MAX_ATTEMPTS = 5
+RETRY_BACKOFF = 0.5
+
+# On-disk cache of generated questions (one JSON object per line), reused across sessions
+QUESTION_CACHE_FILE = "question_cache.jsonl"
+
+# Minimum number of cached questions a topic needs before it is served from the cache
+CACHE_MIN_QUESTIONS = 3
+
+# Chance that such a topic is served from the cache; otherwise a new question is generated
+# so the question bank keeps growing. The cache is always used when Ollama fails.
+CACHE_REUSE_PROBABILITY = 0.25
+
+# Embedding model and cosine similarity above which two questions count as near-duplicates
+EMBEDDING_MODEL = "nomic-embed-text"
+SIMILARITY_THRESHOLD = 0.92
+
+def _run_in_background(fn: Any) -> concurrent.futures.Future:
+    """Run fn on a daemon thread so an abandoned pre-fetch can never delay exit."""
+    future = concurrent.futures.Future()
+    
+    def run() -> None:
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, name="question-prefetch", daemon=True).start()
+    return future
+
+def _load_cache(path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Load cached questions from a JSON Lines file, grouped by topic."""
+    cache = {}
+    if not os.path.exists(path):
+        return cache
+    
+    try:
+        with open(path, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    question_data = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # A partially written line should not invalidate the rest of the cache
+                    logger.warning("Skipping corrupt line in question cache: %s", line.decode('utf-8', 'replace'))
+                    continue
+                cache.setdefault(question_data.get('topic', 'Unknown topic'), []).append(question_data)
+        logger.info("Loaded %s cached questions from %s", sum(len(q) for q in cache.values()), path)
+    except OSError as e:
+        logger.error("Error loading question cache: %s", e)
+    return cache
+
+def _append_to_cache(path: str, question_data: Dict[str, Any]) -> None:
+    """Append one question to the cache file using a single O_APPEND write."""
+    line = orjson.dumps(question_data) + b"\n"
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.error("Error writing to question cache: %s", e)
+
+# Session log lines waiting to be appended by the background writer thread
+_save_queue: "queue.Queue[Tuple[str, bytes]]" = queue.Queue()
+
+def _session_writer() -> None:
+    """Append queued event lines to their session logs."""
+    while True:
+        path, line = _save_queue.get()
+        try:
+            # A single O_APPEND write per event, so a crash can at worst truncate the last line
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+        except Exception as e:
+            logger.error("Error saving session: %s", e)
+        finally:
+            _save_queue.task_done()
+
+threading.Thread(target=_session_writer, name="session-writer", daemon=True).start()
+# Make sure pending saves reach the disk before the interpreter exits
+atexit.register(_save_queue.join)
+
+def _replay_session_log(path: str) -> Dict[str, Any]:
+    """Rebuild the state of a session by applying the events in its log in order."""
+    session_data = {"questions_asked": [], "final_money": 0, "game_over": False}
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                event = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                # A partially written last line should not invalidate the rest of the session
+                logger.warning("Skipping corrupt line in session log %s", path)
+                continue
+            
+            kind = event.pop('event', None)
+            if kind == 'answer':
+                session_data['questions_asked'].append(event)
+                session_data['final_money'] = event.get('amount_won', 0)
+            elif kind in ('start', 'status'):
+                session_data.update(event)
+    return session_data
+
 class MillionaireGame:
-    def __init__(self, player_name: str, model: str = "llama3.2"):
+    def __init__(self, player_name: str, model: str = DEFAULT_MODEL):
         """Initialize a new game session."""
         self.player_name = player_name
         self.model = model
@@ -80,258 +406,300 @@ class MillionaireGame:
         self.used_topics = set()  # Track used topics to avoid repetition
         self.used_questions = set()  # Track used question texts to avoid repetition
         self.fallback_index = 0  # To track which fallback questions have been used
+        self._next_future: Optional[concurrent.futures.Future] = None  # Pre-fetched next question
+        self._question_queue: List[Dict[str, Any]] = []  # Questions generated ahead of time in one batch
+        self._cache = _load_cache(QUESTION_CACHE_FILE)  # Previously generated questions by topic
+        self._cache_hits = Counter()  # Per-topic cache hits
+        self._cache_misses = Counter()  # Per-topic cache misses
+        self._embeddings: Optional[np.ndarray] = None  # Unit-length embeddings of generated questions, one per row
+        self._embeddings_enabled = True  # Disabled if the embedding model is unavailable
+        self._lock = threading.RLock()  # Guards used_topics/used_questions across threads
         self.timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
-        self.session_file = f"{player_name.replace(' ', '_')}-{self.timestamp}.json"
-        logger.info(f"New game started for player: {player_name}")
+        self.session_log = f"{player_name.replace(' ', '_')}-{self.timestamp}.jsonl"
+        self._log_started = False  # Whether the start event has been written to the session log
+        self._legacy_session: Optional[Dict[str, Any]] = None  # Legacy snapshot to migrate on first save
+        logger.info("New game started for player: %s", player_name)
     
     def generate_question(self) -> Dict[str, Any]:
-        """Generate a question using Ollama."""
+        """Return the next question, requesting a new batch from Ollama when none are queued."""
+        with self._lock:
+            if not self._question_queue:
+                self._prefetch_batch()
+            return self._question_queue.pop(0)
+    
+    def _prefetch_batch(self) -> None:
+        """Generate questions for all remaining rungs with a single Ollama call."""
+        # One question per remaining rung of the money ladder
+        count = max(1, len(MONEY_LADDER) - 1 - self.current_question_num)
+        topics = []
         try:
-            # Select a topic that hasn't been used recently
-            available_topics = [topic for topic in TOPICS if topic not in self.used_topics]
-            if not available_topics:
-                # If all topics have been used, reset and use all topics again
+            # Select topics that haven't been used recently
+            available_topics = list(_TOPIC_SET - self.used_topics)
+            if len(available_topics) < count:
+                # Not enough unused topics left, reset and use all topics again
                 available_topics = TOPICS
                 self.used_topics = set()
             
-            topic = random.choice(available_topics)
-            self.used_topics.add(topic)  # Mark this topic as used
+            topics = random.sample(available_topics, min(count, len(available_topics)))
+            self.used_topics.update(topics)  # Mark these topics as used
             
-            # Using triple quotes and raw string to avoid format issues
-            prompt = r"""
-            Create a multiple-choice question for 'Who Wants to be a Millionaire' that tests English language proficiency.
-
-            Topic: """ + topic + r"""
+            # Serve topics from the question cache where possible
+            first_cached = len(self._question_queue)
+            missing_topics = []
+            for topic in topics:
+                question_data = None
+                if (len(self._cache.get(topic, [])) >= CACHE_MIN_QUESTIONS
+                        and random.random() < CACHE_REUSE_PROBABILITY):
+                    question_data = self._take_cached(topic)
+                if question_data:
+                    self._question_queue.append(question_data)
+                    self._cache_hits[topic] += 1
+                else:
+                    missing_topics.append(topic)
+                    self._cache_misses[topic] += 1
             
-            Format your response as valid JSON with these fields:
-            - question (string): The question text
-            - options (array): Four options as strings labeled with "A. ", "B. ", "C. ", "D. " prefixes
-            - correct_answer (string): The letter of the correct option (A, B, C, or D)
-            - explanation (string): A clear explanation of why the answer is correct
-
-            IMPORTANT: Each option should be a simple string starting with the letter label, like "A. Option text here".
-            Do NOT use nested objects or dictionaries for options.
-            Make sure all values are properly quoted in the JSON.
-
-            Example of correct format:
-            {
-              "question": "What is the past tense of 'go'?",
-              "options": [
-                "A. Goed",
-                "B. Went",
-                "C. Gone",
-                "D. Going"
-              ],
-              "correct_answer": "B",
-              "explanation": "The irregular past tense of 'go' is 'went'."
-            }
-
-            The question should be challenging but fair. Provide good distractors for wrong answers.
-            """
+            logger.info("Question cache hits: %s, misses: %s", dict(self._cache_hits), dict(self._cache_misses))
             
-            logger.info(f"Generating question on topic: {topic}")
-            response = ollama.chat(model=self.model, messages=[
-                {
-                    'role': 'user',
-                    'content': prompt,
-                }
-            ])
+            # Cached questions count as earlier questions for the near-duplicate check
+            self._remember_embeddings(self._embed([q['question'] for q in self._question_queue[first_cached:]]))
+            if not missing_topics:
+                return
             
-            content = response.message.content
-            logger.debug(f"Raw response from Ollama: {content}")
+            # Only ask Ollama for the topics the cache couldn't serve
+            topics = missing_topics
+            queued_before = len(self._question_queue)
             
-            # Extract JSON from the response
-            json_start = content.find('{')
-            json_end = content.rfind('}') + 1
-            if json_start >= 0 and json_end > json_start:
-                json_content = content[json_start:json_end]
+            # Retry a bounded number of times if the request fails or yields only duplicates
+            for attempt in range(1, MAX_ATTEMPTS + 1):
                 try:
-                    # Try to fix common JSON formatting issues
-                    # Replace unquoted A, B, C, D with quoted versions
-                    fixed_json = json_content
-                    for label in ["A", "B", "C", "D"]:
-                        fixed_json = fixed_json.replace(f'"label": {label},', f'"label": "{label}",')
-                        fixed_json = fixed_json.replace(f'"correct_answer": {label}', f'"correct_answer": "{label}"')
-                    
-                    logger.debug(f"Attempting to parse JSON: {fixed_json}")
-                    question_data = json.loads(fixed_json)
-                    question_data['topic'] = topic
-                    
-                    # Check if this question has been asked before
-                    question_text = question_data.get('question', '')
-                    if question_text in self.used_questions:
-                        logger.info(f"Question already used, generating another one: {question_text}")
-                        return self.generate_question()  # Try again with a different question
-                    
-                    self.used_questions.add(question_text)  # Mark this question as used
-                    
-                    # Normalize the options format to ensure they're always strings
-                    normalized_options = []
-                    for option in question_data.get('options', []):
-                        if isinstance(option, dict):
-                            # If option is a dict with label and text, combine them
-                            if 'label' in option and 'text' in option:
-                                label = option['label']
-                                text = option['text']
-                                normalized_options.append(f"{label}. {text}")
-                            else:
-                                # If it's some other dict format, convert to string
-                                normalized_options.append(str(option))
-                        else:
-                            # If it's already a string, keep as is
-                            normalized_options.append(str(option))
-                    
-                    # Make sure we have at least 4 options
-                    while len(normalized_options) < 4:
-                        normalized_options.append(f"Option {len(normalized_options) + 1}")
-                    
-                    question_data['options'] = normalized_options
-                    logger.debug(f"Normalized question data: {question_data}")
-                    return question_data
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to parse JSON from Ollama response: {e}")
-                    logger.error(f"Content causing error: {json_content}")
-            
-            logger.error(f"Failed to extract valid JSON from Ollama response: {content}")
-            # Fallback question if Ollama fails
-            return self._generate_fallback_question(topic)
+                    response_data = self._request_batch(topics)
+                except ollama.ResponseError as e:
+                    logger.warning("Ollama request failed (attempt %s of %s): %s", attempt, MAX_ATTEMPTS, e)
+                    # Errors such as a missing model won't go away by retrying
+                    if e.status_code != 429 and e.status_code < 500:
+                        break
+                    if attempt < MAX_ATTEMPTS:
+                        # Back off exponentially to give a busy server time to recover
+                        time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+                    continue
+                
+                if response_data is not None:
+                    self._queue_batch(response_data.get('questions', []), topics)
+                if len(self._question_queue) > queued_before:
+                    break
+                logger.info("No usable questions generated (attempt %s of %s)", attempt, MAX_ATTEMPTS)
+            
+            if len(self._question_queue) == queued_before:
+                logger.error("Failed to get valid questions from Ollama")
+                self._fall_back(topics)
             
         except Exception as e:
-            logger.error(f"Error generating question: {str(e)}", exc_info=True)
-            # Fallback question if Ollama fails
-            return self._generate_fallback_question()
+            logger.error("Error generating questions: %s", e, exc_info=True)
+            if not self._question_queue:
+                self._fall_back(topics)
     
-    def _generate_fallback_question(self, topic: str = "Grammar - Basic") -> Dict[str, Any]:
-        """Generate a fallback question if Ollama fails."""
-        logger.info(f"Using fallback question for topic: {topic}")
+    def _take_cached(self, topic: str) -> Optional[Dict[str, Any]]:
+        """Pick a cached question on the topic that hasn't been used in this game."""
+        unused = [q for q in self._cache.get(topic, []) if q.get('question') not in self.used_questions]
+        if not unused:
+            return None
         
-        # Large pool of fallback questions to avoid repetition
-        fallback_questions = [
-            {
-                "topic": topic,
-                "question": "Which of the following is a correct sentence?",
-                "options": [
-                    "A. I have been to Paris last year.",
-                    "B. I went to Paris last year.",
-                    "C. I have went to Paris last year.",
-                    "D. I had been going to Paris last year."
-                ],
-                "correct_answer": "B",
-                "explanation": "When using a specific time in the past (last year), the simple past tense is correct. 'I went to Paris last year' is grammatically correct."
-            },
-            {
-                "topic": topic,
-                "question": "Which word is a synonym for 'happy'?",
-                "options": [
-                    "A. Sad",
-                    "B. Angry",
-                    "C. Joyful",
-                    "D. Tired"
-                ],
-                "correct_answer": "C",
-                "explanation": "'Joyful' means full of joy or happiness, making it a synonym for 'happy'."
-            },
-            {
-                "topic": topic,
-                "question": "What is the correct spelling?",
-                "options": [
-                    "A. Accomodate",
-                    "B. Acommodate",
-                    "C. Accommodate",
-                    "D. Acomodate"
-                ],
-                "correct_answer": "C",
-                "explanation": "'Accommodate' is the correct spelling with two 'c's and two 'm's."
-            },
-            {
-                "topic": topic,
-                "question": "Which of these is a correct use of the semicolon?",
-                "options": [
-                    "A. I went to the store; and bought milk.",
-                    "B. I went to the store; I bought milk.",
-                    "C. I went to the store, I bought milk.",
-                    "D. I went to the store; because I needed milk."
-                ],
-                "correct_answer": "B",
-                "explanation": "A semicolon is used to join two independent clauses without a conjunction. Option B correctly uses the semicolon to join two complete sentences."
-            },
-            {
-                "topic": topic,
-                "question": "Which sentence contains a dangling modifier?",
-                "options": [
-                    "A. The teacher explained the problem to the students.",
-                    "B. Walking down the street, the birds sang loudly.",
-                    "C. She read the book that I recommended.",
-                    "D. After finishing the assignment, the student went home."
-                ],
-                "correct_answer": "B",
-                "explanation": "In the sentence 'Walking down the street, the birds sang loudly,' the modifier 'walking down the street' is dangling because birds cannot walk down the street. The subject performing the action is missing."
-            },
-            {
-                "topic": topic,
-                "question": "Which of these is the correct plural form of 'child'?",
-                "options": [
-                    "A. Childs",
-                    "B. Childes",
-                    "C. Children",
-                    "D. Childrens"
-                ],
-                "correct_answer": "C",
-                "explanation": "'Children' is the correct irregular plural form of 'child'. It doesn't follow the regular pattern of adding 's' or 'es'."
-            },
-            {
-                "topic": topic,
-                "question": "What is the meaning of the idiom 'to hit the hay'?",
-                "options": [
-                    "A. To beat someone",
-                    "B. To go to sleep",
-                    "C. To work in a farm",
-                    "D. To exercise vigorously"
-                ],
-                "correct_answer": "B",
-                "explanation": "The idiom 'to hit the hay' means to go to bed or go to sleep. It originated from the days when mattresses were filled with hay."
-            },
+        question_data = dict(random.choice(unused))
+        self.used_questions.add(question_data['question'])  # Mark this question as used
+        return question_data
+    
+    def _fall_back(self, topics: List[str]) -> None:
+        """Queue cached questions for topics Ollama couldn't serve, or a built-in fallback question."""
+        for topic in topics:
+            question_data = self._take_cached(topic)
+            if question_data:
+                self._question_queue.append(question_data)
+        
+        # Fallback question if Ollama fails and nothing is cached
+        if not self._question_queue:
+            if topics:
+                self._question_queue.append(self._generate_fallback_question(topics[0]))
+            else:
+                self._question_queue.append(self._generate_fallback_question())
+    
+    def _request_batch(self, topics: List[str]) -> Optional[Dict[str, Any]]:
+        """Ask Ollama for one question per topic and return the parsed response."""
+        prompt = _PROMPT_TMPL.format(count=len(topics), topics="\n".join(f"- {topic}" for topic in topics))
+        
+        logger.info("Generating %s questions on topics: %s", len(topics), ', '.join(topics))
+        stream = ollama.chat(model=self.model, messages=[
             {
-                "topic": topic,
-                "question": "Which sentence uses the correct form of the verb?",
-                "options": [
-                    "A. Each of the students have completed the assignment.",
-                    "B. Neither of my brothers are going to the party.",
-                    "C. The team of doctors has arrived at the hospital.",
-                    "D. The staff were divided on the issue."
-                ],
-                "correct_answer": "C",
-                "explanation": "In the sentence 'The team of doctors has arrived at the hospital,' the singular subject 'team' correctly takes the singular verb 'has'. 'Team' is a collective noun that's treated as singular when referring to the group as a single unit."
+                'role': 'user',
+                'content': prompt,
             }
-        ]
+        ], format=BATCH_SCHEMA, keep_alive=KEEP_ALIVE, options={
+            "num_ctx": NUM_CTX,
+            "temperature": 0.7,
+            # Cap decoding at a fixed budget per requested question
+            "num_predict": NUM_PREDICT_PER_QUESTION * len(topics)
+        }, stream=True)
+        
+        # Stop reading as soon as the top-level JSON object is complete instead of
+        # waiting for any trailing whitespace the model may still emit
+        pieces = []
+        depth = 0
+        for chunk in stream:
+            piece = chunk.message.content
+            pieces.append(piece)
+            depth += piece.count('{') - piece.count('}')
+            if depth == 0 and '}' in piece:
+                content = "".join(pieces)
+                try:
+                    response_data = orjson.loads(content)
+                    logger.debug("Raw response from Ollama: %s", content)
+                    return response_data
+                except orjson.JSONDecodeError:
+                    # A brace inside a string value threw off the count, keep reading
+                    continue
+        
+        content = "".join(pieces)
+        logger.debug("Raw response from Ollama: %s", content)
+        
+        # The schema constrains the model to valid JSON, so no extraction or repair is needed
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse JSON from Ollama response: %s", e)
+            logger.error("Content causing error: %s", content)
+            return None
+    
+    def _queue_batch(self, batch: List[Dict[str, Any]], topics: List[str]) -> None:
+        """Queue the new, non-duplicate questions from a batch and add them to the cache."""
+        candidates = []
+        for i, question_data in enumerate(batch):
+            # Prefer the topic echoed by the model, otherwise match by position
+            topic = question_data.get('topic')
+            if topic not in topics:
+                topic = topics[i] if i < len(topics) else topics[-1]
+            
+            # Check if this question has been asked before
+            question_text = question_data.get('question', '')
+            if question_text in self.used_questions:
+                logger.info("Question already used, skipping it: %s", question_text)
+                continue
+            candidates.append((topic, question_data, question_text))
         
-        # Check if we have any previously unused fallback questions
-        unused_questions = []
-        for question in fallback_questions:
-            if question["question"] not in self.used_questions:
-                unused_questions.append(question)
+        # Embed the whole batch in one request to check for rephrased versions of earlier questions
+        embeddings = self._embed([question_text for _, _, question_text in candidates])
+        if embeddings is not None:
+            # Rows are unit vectors, so matrix products give every cosine similarity at once
+            if self._embeddings is not None:
+                prior_similarity = (self._embeddings @ embeddings.T).max(axis=0)
+            else:
+                prior_similarity = np.full(len(candidates), -1.0)
+            batch_similarity = embeddings @ embeddings.T
         
-        # If we've used all fallback questions, reset and use all again
-        if not unused_questions:
-            unused_questions = fallback_questions
-            # Only remove fallback questions from used_questions
-            fallback_question_texts = {q["question"] for q in fallback_questions}
-            self.used_questions = self.used_questions - fallback_question_texts
+        kept = []
+        for j, (topic, question_data, question_text) in enumerate(candidates):
+            # Guard against the same question appearing twice in one batch
+            if question_text in self.used_questions:
+                logger.info("Question already used, skipping it: %s", question_text)
+                continue
+            
+            # Reject rephrased versions of questions already generated in this game or batch
+            if embeddings is not None and (
+                    prior_similarity[j] > SIMILARITY_THRESHOLD
+                    or any(batch_similarity[j, k] > SIMILARITY_THRESHOLD for k in kept)):
+                logger.info("Question too similar to a previous one, skipping it: %s", question_text)
+                continue
+            kept.append(j)
+            
+            self.used_questions.add(question_text)  # Mark this question as used
+            question_data = self._normalize(question_data, topic)
+            self._question_queue.append(question_data)
+            
+            # Remember the question for future sessions
+            cached = self._cache.setdefault(topic, [])
+            if not any(q.get('question') == question_text for q in cached):
+                cached.append(question_data)
+                _append_to_cache(QUESTION_CACHE_FILE, question_data)
         
-        # Select a random unused question
-        selected_question = random.choice(unused_questions)
-        self.used_questions.add(selected_question["question"])  # Mark as used
+        if embeddings is not None and kept:
+            self._remember_embeddings(embeddings[kept])
+    
+    def _embed(self, texts: List[str]) -> Optional[np.ndarray]:
+        """Embed texts in a single request, returning unit-length rows or None if unavailable."""
+        if not self._embeddings_enabled or not texts:
+            return None
         
-        return selected_question
+        try:
+            response = ollama.embed(model=EMBEDDING_MODEL, input=texts)
+            embeddings = np.asarray(response['embeddings'], dtype=np.float32)
+        except Exception as e:
+            logger.warning("Embedding model unavailable, skipping similarity check: %s", e)
+            self._embeddings_enabled = False
+            return None
+        return embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    
+    def _remember_embeddings(self, embeddings: Optional[np.ndarray]) -> None:
+        """Add embeddings of questions used in this game to the ones new questions are checked against."""
+        if embeddings is None:
+            return
+        if self._embeddings is None:
+            self._embeddings = embeddings
+        else:
+            self._embeddings = np.vstack([self._embeddings, embeddings])
+    
+    def _normalize(self, question_data: Dict[str, Any], topic: str) -> Dict[str, Any]:
+        """Normalize a generated question so its options are always plain strings."""
+        question_data['topic'] = topic
+        
+        # Normalize the options format to ensure they're always strings
+        normalized_options = []
+        for option in question_data.get('options', []):
+            if isinstance(option, dict):
+                # If option is a dict with label and text, combine them
+                if 'label' in option and 'text' in option:
+                    label = option['label']
+                    text = option['text']
+                    normalized_options.append(f"{label}. {text}")
+                else:
+                    # If it's some other dict format, convert to string
+                    normalized_options.append(str(option))
+            else:
+                # If it's already a string, keep as is
+                normalized_options.append(str(option))
+        
+        # Make sure we have at least 4 options
+        while len(normalized_options) < 4:
+            normalized_options.append(f"Option {len(normalized_options) + 1}")
+        
+        question_data['options'] = normalized_options
+        logger.debug("Normalized question data: %s", question_data)
+        return question_data
+    
+    def _generate_fallback_question(self, topic: str = "Grammar - Basic") -> Dict[str, Any]:
+        """Generate a fallback question if Ollama fails."""
+        logger.info("Using fallback question for topic: %s", topic)
+        
+        with self._lock:
+            # If we've used all fallback questions, reset and use all again
+            if _FALLBACK_QS <= self.used_questions:
+                # Only remove fallback questions from used_questions
+                self.used_questions -= _FALLBACK_QS
+            
+            # Collect the previously unused fallback questions
+            unused_questions = [q for q in _FALLBACK_POOL if q["question"] not in self.used_questions]
+            
+            # Select a random unused question
+            selected_question = random.choice(unused_questions)
+            self.used_questions.add(selected_question["question"])  # Mark as used
+        
+        return {"topic": topic, **selected_question}
     
     def display_question(self, question_data: Dict[str, Any]) -> None:
         """Display the question and options to the user."""
         try:
-            amount = MONEY_LADDER[self.current_question_num + 1]
+            amount = _MONEY_STR[self.current_question_num + 1]
             print("\n" + "=" * 60)
-            print(Fore.YELLOW + f"Question for ${amount:,}")
-            print(Fore.YELLOW + f"Topic: {question_data['topic']}")
-            print(Fore.GREEN + f"\n{question_data['question']}\n")
+            print(f"{_Y}Question for {amount}")
+            print(f"{_Y}Topic: {question_data['topic']}")
+            print(f"{_G}\n{question_data['question']}\n")
             
             # Make sure options is a list of strings
             if 'options' not in question_data:
@@ -343,22 +711,22 @@ class MillionaireGame:
             for i, option in enumerate(options):
                 # Handle if option is not a string
                 option_str = str(option)
-                print(Fore.CYAN + option_str)
+                print(f"{_C}{option_str}")
             
             print("=" * 60 + "\n")
         except Exception as e:
-            logger.error(f"Error displaying question: {str(e)}", exc_info=True)
+            logger.error("Error displaying question: %s", e, exc_info=True)
             # Print a simplified version as fallback
             print("\n" + "=" * 60)
-            print(Fore.YELLOW + "Question:")
+            print(f"{_Y}Question:")
             try:
-                print(Fore.GREEN + question_data.get('question', 'Missing question'))
-                print(Fore.CYAN + "A. Option A")
-                print(Fore.CYAN + "B. Option B")
-                print(Fore.CYAN + "C. Option C")
-                print(Fore.CYAN + "D. Option D")
+                print(f"{_G}{question_data.get('question', 'Missing question')}")
+                print(f"{_C}A. Option A")
+                print(f"{_C}B. Option B")
+                print(f"{_C}C. Option C")
+                print(f"{_C}D. Option D")
             except:
-                print(Fore.RED + "Error displaying question details")
+                print(f"{_R}Error displaying question details")
             print("=" * 60 + "\n")
     
     def process_answer(self, user_answer: str, question_data: Dict[str, Any]) -> bool:
@@ -374,22 +742,22 @@ class MillionaireGame:
             if len(correct_answer) > 1:
                 correct_answer = correct_answer[0]  # Take only the first character
             
-            logger.debug(f"User answer: {user_answer}, Correct answer: {correct_answer}")
+            logger.debug("User answer: %s, Correct answer: %s", user_answer, correct_answer)
             is_correct = user_answer.upper() == correct_answer
             
             if is_correct:
                 self.current_question_num += 1
                 self.current_money = MONEY_LADDER[self.current_question_num]
                 
-                print(Fore.GREEN + Back.BLACK + Style.BRIGHT + f"\nCORRECT! You now have ${self.current_money:,}!" + Style.RESET_ALL)
+                print(f"{_G}{_ON_BLACK}{_BRIGHT}\nCORRECT! You now have {_MONEY_STR[self.current_question_num]}!{_RESET}")
                 
                 # Display explanation
-                print(Fore.WHITE + Back.BLUE + "\nEXPLANATION:" + Style.RESET_ALL)
+                print(f"{_W}{_ON_BLUE}\nEXPLANATION:{_RESET}")
                 explanation = question_data.get('explanation', "No explanation provided.")
-                print(Fore.WHITE + explanation + Style.RESET_ALL)
+                print(f"{_W}{explanation}{_RESET}")
                 
                 # Record question in history
-                self.questions_asked.append({
+                entry = {
                     "question_num": self.current_question_num,
                     "question": question_data.get('question', 'Unknown question'),
                     "options": question_data.get('options', []),
@@ -398,27 +766,25 @@ class MillionaireGame:
                     "explanation": explanation,
                     "topic": question_data.get('topic', 'Unknown topic'),
                     "amount_won": self.current_money
-                })
+                }
+                self.questions_asked.append(entry)
+                self._log_event("answer", **entry)
                 
                 return True
             else:
                 # Determine money to fall back to
-                money_to_fall_back = 0
-                for milestone in reversed(MILESTONES):
-                    if milestone <= self.current_money:
-                        money_to_fall_back = milestone
-                        break
+                money_to_fall_back = _FALLBACK[self.current_question_num]
                 
-                print(Fore.RED + Back.BLACK + Style.BRIGHT + f"\nI'm sorry, that's incorrect." + Style.RESET_ALL)
-                print(Fore.RED + f"The correct answer was {correct_answer}." + Style.RESET_ALL)
+                print(f"{_R}{_ON_BLACK}{_BRIGHT}\nI'm sorry, that's incorrect.{_RESET}")
+                print(f"{_R}The correct answer was {correct_answer}.{_RESET}")
                 
                 # Display explanation
-                print(Fore.WHITE + Back.BLUE + "\nEXPLANATION:" + Style.RESET_ALL)
+                print(f"{_W}{_ON_BLUE}\nEXPLANATION:{_RESET}")
                 explanation = question_data.get('explanation', "No explanation provided.")
-                print(Fore.WHITE + explanation + Style.RESET_ALL)
+                print(f"{_W}{explanation}{_RESET}")
                 
                 # Record question in history
-                self.questions_asked.append({
+                entry = {
                     "question_num": self.current_question_num + 1,
                     "question": question_data.get('question', 'Unknown question'),
                     "options": question_data.get('options', []),
@@ -427,53 +793,80 @@ class MillionaireGame:
                     "explanation": explanation,
                     "topic": question_data.get('topic', 'Unknown topic'),
                     "amount_won": money_to_fall_back
-                })
+                }
+                self.questions_asked.append(entry)
+                self._log_event("answer", **entry)
                 
                 self.current_money = money_to_fall_back
                 
-                print(Fore.YELLOW + f"\nYou fall back to ${money_to_fall_back:,}" + Style.RESET_ALL)
+                print(f"{_Y}\nYou fall back to {_MONEY_STR[_MONEY_TO_RUNG[money_to_fall_back]]}{_RESET}")
                 self.game_over = True
                 return False
         
         except Exception as e:
-            logger.error(f"Error processing answer: {str(e)}", exc_info=True)
-            print(Fore.RED + "There was an error processing your answer. Please try again." + Style.RESET_ALL)
+            logger.error("Error processing answer: %s", e, exc_info=True)
+            print(f"{_R}There was an error processing your answer. Please try again.{_RESET}")
             return False
     
+    def _log_event(self, event: str, **fields: Any) -> None:
+        """Queue one event line for appending to the session log."""
+        if not self._log_started:
+            # Every session log begins with a start event
+            self._log_started = True
+            self._log_event("start", player_name=self.player_name, timestamp=self.timestamp,
+                            model_used=self.model)
+            
+            if self._legacy_session is not None:
+                # Carry the history and state of a legacy snapshot over into its new session log
+                legacy_session, self._legacy_session = self._legacy_session, None
+                for entry in legacy_session['questions_asked']:
+                    self._log_event("answer", **entry)
+                self._log_event("status", final_money=legacy_session['final_money'],
+                                game_over=legacy_session['game_over'])
+        
+        # Hand the line to the background writer so the game doesn't wait on disk I/O
+        _save_queue.put((self.session_log, orjson.dumps({"event": event, **fields}) + b"\n"))
+    
     def save_session(self) -> None:
-        """Save the current game session to a JSON file."""
+        """Record the current money and game state in the session log."""
         try:
-            session_data = {
-                "player_name": self.player_name,
-                "timestamp": self.timestamp,
-                "model_used": self.model,
-                "final_money": self.current_money,
-                "questions_asked": self.questions_asked,
-                "game_over": self.game_over,
-                "used_topics": list(self.used_topics),  # Convert set to list for JSON serialization
-                "used_questions": list(self.used_questions)  # Convert set to list for JSON serialization
-            }
-            
-            with open(self.session_file, 'w') as f:
-                json.dump(session_data, f, indent=4)
+            self._log_event("status", final_money=self.current_money, game_over=self.game_over)
             
-            logger.info(f"Game session saved to {self.session_file}")
-            print(Fore.GREEN + f"\nGame session saved to {self.session_file}" + Style.RESET_ALL)
+            print(Fore.GREEN + f"\nGame session saved to {self.session_log}" + Style.RESET_ALL)
         
         except Exception as e:
-            logger.error(f"Error saving session: {str(e)}")
+            logger.error("Error saving session: %s", e)
             print(Fore.RED + f"\nError saving session: {str(e)}" + Style.RESET_ALL)
     
     @classmethod
     def load_session(cls, filename: str) -> Optional['MillionaireGame']:
-        """Load a game session from a JSON file."""
+        """Load a game session from a session log, or from a legacy JSON snapshot."""
         try:
-            with open(filename, 'r') as f:
-                session_data = json.load(f)
+            # Wait for any queued saves so we never read a stale session
+            _save_queue.join()
+            
+            if not filename.endswith('.jsonl'):
+                # A legacy snapshot that has already been continued is loaded from its session log
+                log_file = os.path.splitext(filename)[0] + ".jsonl"
+                if os.path.exists(log_file):
+                    filename = log_file
+            
+            if filename.endswith('.jsonl'):
+                session_data = _replay_session_log(filename)
+            else:
+                with open(filename, 'rb') as f:
+                    session_data = orjson.loads(f.read())
             
             game = cls(session_data['player_name'], session_data['model_used'])
             game.timestamp = session_data['timestamp']
-            game.session_file = filename
+            if filename.endswith('.jsonl'):
+                game.session_log = filename
+                game._log_started = True
+            else:
+                # Continue a legacy snapshot in a new log next to it, written on the first save
+                game.session_log = os.path.splitext(filename)[0] + ".jsonl"
+                # Snapshot the history, since questions_asked keeps growing before the first save
+                game._legacy_session = dict(session_data, questions_asked=list(session_data['questions_asked']))
             game.current_money = session_data['final_money']
             game.questions_asked = session_data['questions_asked']
             game.game_over = session_data['game_over']
@@ -488,12 +881,9 @@ class MillionaireGame:
                     game.used_topics.add(q['topic'])
             
             # Determine current question number based on money won
-            for i, amount in enumerate(MONEY_LADDER):
-                if amount == game.current_money:
-                    game.current_question_num = i
-                    break
+            game.current_question_num = _MONEY_TO_RUNG.get(game.current_money, 0)
             
-            logger.info(f"Game session loaded from {filename}")
+            logger.info("Game session loaded from %s", filename)
             print(Fore.GREEN + f"\nGame session loaded from {filename}" + Style.RESET_ALL)
             print(Fore.YELLOW + f"Player: {game.player_name}, Money: ${game.current_money:,}" + Style.RESET_ALL)
             
@@ -507,23 +897,31 @@ class MillionaireGame:
             return game
         
         except Exception as e:
-            logger.error(f"Error loading session: {str(e)}")
+            logger.error("Error loading session: %s", e)
             print(Fore.RED + f"\nError loading session: {str(e)}" + Style.RESET_ALL)
             return None
     
     def display_status(self) -> None:
         """Display the current game status."""
         print("\n" + "-" * 60)
-        print(Fore.YELLOW + f"Player: {self.player_name}" + Style.RESET_ALL)
-        print(Fore.YELLOW + f"Current Money: ${self.current_money:,}" + Style.RESET_ALL)
+        print(f"{_Y}Player: {self.player_name}{_RESET}")
+        print(f"{_Y}Current Money: {_MONEY_STR[self.current_question_num]}{_RESET}")
         
         # Show next question amount if game is not over
         if not self.game_over and self.current_question_num < len(MONEY_LADDER) - 1:
-            next_amount = MONEY_LADDER[self.current_question_num + 1]
-            print(Fore.YELLOW + f"Next Question Worth: ${next_amount:,}" + Style.RESET_ALL)
+            print(f"{_Y}Next Question Worth: {_MONEY_STR[self.current_question_num + 1]}{_RESET}")
         
         print("-" * 60 + "\n")
 
+def warm_up_model(model: str = DEFAULT_MODEL) -> None:
+    """Load the model into memory so the first question doesn't pay the model load time."""
+    try:
+        # A request without a prompt only loads the model, it doesn't generate anything
+        ollama.generate(model=model, keep_alive=KEEP_ALIVE)
+        logger.info("Model %s loaded", model)
+    except Exception as e:
+        logger.warning("Could not preload model %s: %s", model, e)
+
 def display_welcome() -> None:
     """Display the welcome screen."""
     print("\n" + "=" * 80)
@@ -534,7 +932,10 @@ def display_welcome() -> None:
 def list_saved_sessions() -> List[str]:
     """List all saved game sessions."""
     try:
-        files = [f for f in os.listdir('.') if f.endswith('.json') and '-' in f]
+        # scandir's cached entry type avoids a stat() call per file
+        with os.scandir('.') as entries:
+            files = sorted(entry.name for entry in entries
+                           if entry.name.endswith(('.json', '.jsonl')) and '-' in entry.name and entry.is_file())
         if not files:
             print(Fore.YELLOW + "No saved sessions found." + Style.RESET_ALL)
         else:
@@ -543,7 +944,7 @@ def list_saved_sessions() -> List[str]:
                 print(f"{i}. {f}")
         return files
     except Exception as e:
-        logger.error(f"Error listing saved sessions: {str(e)}")
+        logger.error("Error listing saved sessions: %s", e)
         print(Fore.RED + f"Error listing saved sessions: {str(e)}" + Style.RESET_ALL)
         return []
 
@@ -551,6 +952,9 @@ def main() -> None:
     """Main function to run the game."""
     display_welcome()
     
+    # Load the model in the background while the player picks a game and enters their name
+    threading.Thread(target=warm_up_model, name="model-warmup", daemon=True).start()
+    
     # Initialize game or load saved session
     while True:
         print(Fore.GREEN + "1. Start New Game" + Style.RESET_ALL)
@@ -594,9 +998,18 @@ def main() -> None:
     while not game.game_over:
         game.display_status()
         
-        question_data = game.generate_question()
+        # Use the question generated in the background if one is pending
+        if game._next_future:
+            question_data = game._next_future.result()
+            game._next_future = None
+        else:
+            question_data = game.generate_question()
         game.display_question(question_data)
         
+        # Start generating the next question while the player thinks about this one
+        if game.current_question_num + 1 < len(MONEY_LADDER) - 1:
+            game._next_future = _run_in_background(game.generate_question)
+        
         while True:
             user_input = input("Your answer (A/B/C/D) or type EXIT to quit: ").strip().upper()
             
@@ -618,13 +1031,16 @@ def main() -> None:
         
         # Ask if player wants to continue or cash out
         if game.current_money > 0:
-            continue_choice = input(f"\nYou have ${game.current_money:,}. Do you want to continue? (Y/N): ").strip().upper()
+            continue_choice = input(f"\nYou have {_MONEY_STR[game.current_question_num]}. Do you want to continue? (Y/N): ").strip().upper()
             if continue_choice != 'Y':
-                print(Fore.GREEN + f"\nCongratulations! You're taking home ${game.current_money:,}!" + Style.RESET_ALL)
+                print(Fore.GREEN + f"\nCongratulations! You're taking home {_MONEY_STR[game.current_question_num]}!" + Style.RESET_ALL)
                 game.game_over = True
                 game.save_session()
                 break
     
+    # Any question still being pre-fetched is no longer needed
+    game._next_future = None
+    
     # End of game
     if game.current_money > 0:
         print(Fore.YELLOW + Back.BLACK + Style.BRIGHT + f"\nGame Over! You won ${game.current_money:,}!" + Style.RESET_ALL)
@@ -645,7 +1061,7 @@ if __name__ == "__main__":
         print(Fore.YELLOW + "\n\nGame interrupted. Exiting gracefully..." + Style.RESET_ALL)
         sys.exit(0)
     except Exception as e:
-        logger.critical(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.critical("Unexpected error: %s", e, exc_info=True)
         print(Fore.RED + f"\nAn unexpected error occurred: {str(e)}" + Style.RESET_ALL)
         print(Fore.RED + "Please check the log file for details." + Style.RESET_ALL)
         sys.exit(1)
\ No newline at end of file